@@ -1,10 +1,13 @@
 # TAGS: [admin]
 
+import asyncio
+import functools
 import logging
 import os
 from pathlib import Path
 from typing import Optional
 
+import aiofiles
 from telegram import InputFile, Update
 from telegram.constants import ParseMode
 from telegram.error import TelegramError
@@ -12,17 +15,30 @@ from telegram.ext import Application, ContextTypes
 
 logger = logging.getLogger(__name__)
 
+# Admin ID never changes during process lifetime, so read it once at import time
+# instead of hitting os.getenv on every handler invocation
+ADMIN_ID: str = os.getenv("ADMIN_ID", "")
+ADMIN_ID_INT: Optional[int] = int(ADMIN_ID) if ADMIN_ID.isdigit() else None
+
+# Data directory never changes during process lifetime either: resolve the env
+# variable and build the Path once instead of per pull-file request
+USERS_DATA_DIR = Path(os.getenv("USERS_DATA_DIR", "/users_data"))
+_USERS_DATA_DIR_RESOLVED = USERS_DATA_DIR.resolve()
+if not USERS_DATA_DIR.exists():
+    logger.warning(f"USERS_DATA_DIR {USERS_DATA_DIR} does not exist at import time")
+
+# File extensions admin_pull_file_command is allowed to send, built once at import time
+_VALID_PULL_EXTENSIONS = frozenset({".log", ".json", ".mp4"})
+_VALID_PULL_EXTENSIONS_STR = ", ".join(sorted(_VALID_PULL_EXTENSIONS))
+
 from services.data_service import (
-    get_tg_user_data_attribute_from_update_object,
     get_list_of_users_from_records,
-    get_target_vacancy_id_from_records,
+    get_user_record,
 )
 from services.status_validation_service import (
-    is_user_in_records,
-    is_vacancy_description_recieved,
-    is_vacancy_sourcing_criterias_recieved,
-    is_vacancy_selected,
-    is_vacany_data_enough_for_resume_analysis,
+    UserStatus,
+    get_status_bits_from_record,
+    is_record_data_enough_for_resume_analysis,
 )
 from services.questionnaire_service import send_message_to_user
 from services.constants import (
@@ -47,600 +63,541 @@ from manager_bot import (
 ##########################################
 
 
-async def admin_get_managers_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+# Per-target-user task queues: work for one user runs in FIFO order,
+# work for different users runs concurrently
+_user_queues: dict = {}
+_user_workers: dict = {}
+
+# Telegram file_id of previously uploaded pull-files, keyed by (path, mtime)
+# so a rewritten file invalidates its entry automatically
+_file_id_cache: dict = {}
+
+
+async def _notify_admin_error(context: ContextTypes.DEFAULT_TYPE, handler_name: str, bot_user_id: str, e: Exception) -> None:
+    #TAGS: [admin]
+    """Log a handler failure and notify the admin. Shared error tail for all admin handlers."""
+    logger.error(f"{handler_name}: Failed: {e}", exc_info=True)
+    # Send notification to admin about the error
+    if context.application:
+        await send_message_to_admin(
+            application=context.application,
+            text=f"⚠️ Error {handler_name}: {e}\nAdmin ID: {bot_user_id or 'unknown'}"
+        )
+
+
+async def _run_and_report(coro, update: Update, context: ContextTypes.DEFAULT_TYPE, task_name: str, success_text: str) -> None:
     #TAGS: [admin]
     """
-    Admin command to list all user IDs from users records.
-    Usage: /admin_get_managers
+    Await a long-running admin task in the background and report the outcome.
+    Lets the handler ack the Telegram update immediately instead of blocking
+    on backend work that can take seconds to minutes.
     """
-
     try:
-        # ----- IDENTIFY USER and pull required data from records -----
+        await coro
+        await send_message_to_user(update, context, text=success_text)
+    except Exception as e:
+        await _notify_admin_error(context, task_name, ADMIN_ID, e)
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_get_managers_command: started. User_id: {bot_user_id}")
-        
-        #  ----- VALIDATION -----
 
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
+async def _user_queue_worker(target_user_id: str, queue: asyncio.Queue) -> None:
+    #TAGS: [admin]
+    """Drain queued admin tasks for one target user, one at a time."""
+    while True:
+        coro, update, context, task_name, success_text = await queue.get()
+        try:
+            await _run_and_report(coro, update, context, task_name, success_text)
+        except Exception as e:
+            logger.error(f"_user_queue_worker: task for user {target_user_id} failed: {e}", exc_info=True)
+        finally:
+            queue.task_done()
 
-        # ----- SEND LIST OF USERS IDs from records -----
 
-        user_ids = get_list_of_users_from_records()
+def enqueue_for_user(target_user_id: str, item: tuple) -> None:
+    #TAGS: [admin]
+    """
+    Queue an admin task item (coro, update, context, task_name, success_text)
+    for a target user. A dedicated worker per user keeps tasks for the same
+    user ordered, while tasks for different users do not block each other.
+    """
+    queue = _user_queues.setdefault(target_user_id, asyncio.Queue())
+    if target_user_id not in _user_workers:
+        _user_workers[target_user_id] = asyncio.create_task(_user_queue_worker(target_user_id, queue))
+    queue.put_nowait(item)
 
-        await send_message_to_user(update, context, text=f"📋 List of users: {user_ids}")
-    
-    except Exception as e:
-        logger.error(f"admin_get_managers_command: Failed: {e}", exc_info=True)        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_get_managers_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
-            )
+
+def _dispatch_background(coro, update: Update, context: ContextTypes.DEFAULT_TYPE, task_name: str, success_text: str, target_user_id: str) -> None:
+    #TAGS: [admin]
+    """Schedule a long-running admin task on the target user's queue without awaiting it in the handler."""
+    enqueue_for_user(target_user_id, (coro, update, context, task_name, success_text))
 
 
-async def admin_get_manager_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+async def shutdown_user_queues() -> None:
     #TAGS: [admin]
     """
-    Admin command to get status of a specific user.
-    Usage: /admin_get_manager_status [user_id]
+    Cancel the per-user queue workers and close any still-pending task
+    coroutines. Called once from the main.py shutdown sequence, alongside the
+    ai_task_queue and admin-notifier stops.
+    """
+    for worker in _user_workers.values():
+        worker.cancel()
+    for target_user_id, worker in _user_workers.items():
+        try:
+            await worker
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error(f"shutdown_user_queues: worker for user {target_user_id} failed during shutdown: {e}", exc_info=True)
+    _user_workers.clear()
+    dropped = 0
+    for queue in _user_queues.values():
+        while not queue.empty():
+            coro = queue.get_nowait()[0]
+            # Close the never-started backend coroutine so it does not emit a
+            # 'coroutine was never awaited' warning at garbage collection
+            coro.close()
+            dropped += 1
+    _user_queues.clear()
+    if dropped:
+        logger.warning(f"shutdown_user_queues: dropped {dropped} pending admin task(s) at shutdown")
+
+
+def _parse_single_user_id_arg(context: ContextTypes.DEFAULT_TYPE) -> str:
+    #TAGS: [admin]
+    """
+    Return the single user_id argument of an admin command. Tuple unpacking
+    fuses the arity check into one operation; raises the same ValueError
+    messages the handlers always used for wrong arity / empty values.
     """
-
     try:
-        # ----- IDENTIFY USER and pull required data from records -----
+        (target_user_id,) = context.args or ()
+    except ValueError:
+        raise ValueError(f"Invalid number of arguments.")
+    if not target_user_id:
+        raise ValueError(f"Invalid command arguments.")
+    return target_user_id
+
+
+def admin_only(func):
+    #TAGS: [admin]
+    """
+    Decorator that runs the admin authorization preamble once for every admin handler:
+    identifies the user, validates against the cached ADMIN_ID, rejects unauthorized
+    requests, and wraps the handler body in the shared error-notify tail.
+    The wrapped handler receives the already-extracted 'bot_user_id' as keyword argument.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_get_manager_status_command: started. User_id: {bot_user_id}")
+        # ----- IDENTIFY USER -----
+
+        uid_int = update.effective_user.id if update.effective_user else None
+        logger.info(f"{func.__name__}: started. User_id: {uid_int}")
 
         #  ----- VALIDATION -----
 
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
+        # Telegram user ids are ints on the wire: compare against the cached
+        # ADMIN_ID_INT directly, no str() allocation on the auth gate
+        if ADMIN_ID_INT is None or uid_int != ADMIN_ID_INT:
+            logger.error(f"Unauthorized for {uid_int}")
+            # Admin commands are a public attack surface (anyone can send
+            # /admin_*), so keep the rejection path as cheap as possible:
+            # one direct send, bypassing the send_message_to_user wrapper
+            # and its keyboard bookkeeping
+            if update.effective_chat:
+                await context.bot.send_message(chat_id=update.effective_chat.id, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
             return
 
-        # ----- PARSE COMMAND ARGUMENTS -----
+        # Downstream handlers log and message with the string form
+        bot_user_id = str(uid_int)
+        try:
+            return await func(update, context, bot_user_id=bot_user_id)
+        except Exception as e:
+            await _notify_admin_error(context, func.__name__, bot_user_id, e)
 
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    await inform_admin_about_user_readiness(bot_user_id=target_user_id, application=context.application)
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
-            else:
-                raise ValueError(f"Invalid command arguments.")
-        else:
-            raise ValueError(f"Invalid number of arguments.")
-    
-    except Exception as e:
-        logger.error(f"admin_get_manager_status_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_get_manager_status_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
-            )
+    return wrapper
 
 
-async def admin_analyze_sourcing_criterais_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_get_managers_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
-    Admin command to analyze sourcing criterias for a specific user.
-    Usage: /admin_analyze_criterias [user_id]
+    Admin command to list all user IDs from users records.
+    Usage: /admin_get_managers
     """
 
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
+    # ----- SEND LIST OF USERS IDs from records -----
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_analyze_sourcing_criterais_command: started. User_id: {bot_user_id}")
+    user_ids = get_list_of_users_from_records()
 
-        #  ----- VALIDATION -----
+    await send_message_to_user(update, context, text=f"📋 List of users: {user_ids}")
 
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
 
-        # ----- PARSE COMMAND ARGUMENTS -----
+@admin_only
+async def admin_get_manager_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
+    #TAGS: [admin]
+    """
+    Admin command to get status of a specific user.
+    Usage: /admin_get_manager_status [user_id]
+    """
 
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    if is_vacancy_description_recieved(record_id=target_user_id):
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-                        # - TRIGGER TASK to analyze sourcing criterias -
+    target_user_id = _parse_single_user_id_arg(context)
 
-                        await define_sourcing_criterias_triggered_by_admin_command(bot_user_id=target_user_id)
-                        await send_message_to_user(update, context, text=f"Task for analysing sourcing criterias completed for user {target_user_id}.")
-                    else:
-                        raise ValueError(f"User {target_user_id} does not have vacancy description to analyze.")
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
-            else:
-                raise ValueError(f"Invalid command arguments.")
-        else:
-            raise ValueError(f"Invalid number of arguments.")
-    
-    except Exception as e:
-        logger.error(f"admin_analyze_sourcing_criterais_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_analyze_sourcing_criterais_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
-            )
+    if get_user_record(record_id=target_user_id) is not None:
+        await inform_admin_about_user_readiness(bot_user_id=target_user_id, application=context.application)
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
 
 
-async def admin_send_sourcing_criterais_to_user_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_analyze_sourcing_criterais_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
-    Admin command to send sourcing criterias to a specific user.
-    Usage: /admin_send_criterias_to_user [user_id]
+    Admin command to analyze sourcing criterias for a specific user.
+    Usage: /admin_analyze_criterias [user_id]
     """
 
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_send_sourcing_criterais_to_user_command: started. User_id: {bot_user_id}")
+    target_user_id = _parse_single_user_id_arg(context)
 
-        #  ----- VALIDATION -----
+    record = get_user_record(record_id=target_user_id)
+    if record is not None:
+        if get_status_bits_from_record(record) & UserStatus.VACANCY_DESC_RECEIVED:
 
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
+            # - TRIGGER TASK to analyze sourcing criterias on the user's queue -
+
+            # Ack before enqueueing so the 'queued' reply always precedes the task outcome
+            await send_message_to_user(update, context, text=f"Task for analysing sourcing criterias queued for user {target_user_id}.")
+            _dispatch_background(
+                define_sourcing_criterias_triggered_by_admin_command(bot_user_id=target_user_id),
+                update, context,
+                task_name="admin_analyze_sourcing_criterais_command",
+                success_text=f"Task for analysing sourcing criterias completed for user {target_user_id}.",
+                target_user_id=target_user_id,
+            )
+        else:
+            raise ValueError(f"User {target_user_id} does not have vacancy description to analyze.")
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
+
+
+@admin_only
+async def admin_send_sourcing_criterais_to_user_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
+    #TAGS: [admin]
+    """
+    Admin command to send sourcing criterias to a specific user.
+    Usage: /admin_send_criterias_to_user [user_id]
+    """
 
-        # ----- PARSE COMMAND ARGUMENTS -----
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    logger.debug(f"User {target_user_id} found in records.")
-                    if is_vacancy_sourcing_criterias_recieved(record_id=target_user_id):
+    target_user_id = _parse_single_user_id_arg(context)
 
-                        # - TRIGGER TASK to send sourcing criterias to user -
+    record = get_user_record(record_id=target_user_id)
+    if record is not None:
+        logger.debug(f"User {target_user_id} found in records.")
+        if get_status_bits_from_record(record) & UserStatus.SOURCING_CRITERIAS_RECEIVED:
 
-                        await send_to_user_sourcing_criterias_triggered_by_admin_command(bot_user_id=target_user_id, application=context.application)
-                        await send_message_to_user(update, context, text=f"Sourcing criterias sent to user {target_user_id}.")
-                    else:
-                        raise ValueError(f"User {target_user_id} does not have sourcing criterias to send.")
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
-            else:
-                raise ValueError(f"Invalid command arguments.")
-        else:
-            raise ValueError(f"Invalid number of arguments.")
-    
-    except Exception as e:
-        logger.error(f"admin_send_sourcing_criterais_to_user_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_send_sourcing_criterais_to_user_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
+            # - TRIGGER TASK to send sourcing criterias to user on the user's queue -
+
+            # Ack before enqueueing so the 'queued' reply always precedes the task outcome
+            await send_message_to_user(update, context, text=f"Task for sending sourcing criterias queued for user {target_user_id}.")
+            _dispatch_background(
+                send_to_user_sourcing_criterias_triggered_by_admin_command(bot_user_id=target_user_id, application=context.application),
+                update, context,
+                task_name="admin_send_sourcing_criterais_to_user_command",
+                success_text=f"Sourcing criterias sent to user {target_user_id}.",
+                target_user_id=target_user_id,
             )
+        else:
+            raise ValueError(f"User {target_user_id} does not have sourcing criterias to send.")
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
 
 
-async def admin_update_negotiations_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_update_negotiations_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
     Admin command to update negotiations for a specific user.
     Usage: /admin_update_neg_coll [user_id]
     """
 
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_update_negotiations_command: started. User_id: {bot_user_id}")
+    target_user_id = _parse_single_user_id_arg(context)
 
-        #  ----- VALIDATION -----
+    record = get_user_record(record_id=target_user_id)
+    if record is not None:
+        if get_status_bits_from_record(record) & UserStatus.VACANCY_SELECTED:
 
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
-
-        # ----- PARSE COMMAND ARGUMENTS -----
-
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    if is_vacancy_selected(record_id=target_user_id):
+            # - TRIGGER TASK to update negotiations in the background and ack immediately -
 
-                        # - TRIGGER TASK to update negotiations -
-
-                        await source_negotiations_triggered_by_admin_command(bot_user_id=target_user_id) # ValueError raised if fails
-                        await send_message_to_user(update, context, text=f"Negotiations collection updated for user {target_user_id}.")
-                    else:
-                        raise ValueError(f"User {target_user_id} did not select a vacancy.")
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
-            else:
-                raise ValueError(f"Invalid command arguments.")
-        else:
-            raise ValueError(f"Invalid number of arguments.")
-    
-    except Exception as e:
-        logger.error(f"admin_update_negotiations_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_update_negotiations_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
+            # Ack before enqueueing so the 'queued' reply always precedes the task outcome
+            await send_message_to_user(update, context, text=f"Task for updating negotiations queued for user {target_user_id}.")
+            _dispatch_background(
+                source_negotiations_triggered_by_admin_command(bot_user_id=target_user_id), # ValueError raised if fails
+                update, context,
+                task_name="admin_update_negotiations_command",
+                success_text=f"Negotiations collection updated for user {target_user_id}.",
+                target_user_id=target_user_id,
             )
+        else:
+            raise ValueError(f"User {target_user_id} did not select a vacancy.")
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
 
 
-async def admin_get_fresh_resumes_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_get_fresh_resumes_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
     Admin command to get fresh resumes for a specific user.
     Usage: /admin_get_fresh_resumes [user_id]
     """
 
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_get_fresh_resumes_command: started. User_id: {bot_user_id}")
-        
-        #  ----- VALIDATION -----
-
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
+    target_user_id = _parse_single_user_id_arg(context)
 
-        # ----- PARSE COMMAND ARGUMENTS -----
+    record = get_user_record(record_id=target_user_id)
+    if record is not None:
+        if is_record_data_enough_for_resume_analysis(record=record):
 
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    if is_vacany_data_enough_for_resume_analysis(user_id=target_user_id):
+            # - TRIGGER TASK to collect fresh resumes on the user's queue -
 
-                        # - TRIGGER TASK to collect fresh resumes -
-
-                        await source_resumes_triggered_by_admin_command(bot_user_id=target_user_id)
-                        await send_message_to_user(update, context, text=f"Fresh resumes collected for user {target_user_id}.")
-                    else:
-                        raise ValueError(f"User {target_user_id} does not have enough vacancy data for resume analysis. Skipping collection of fresh resumes.")
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
-            else:
-                raise ValueError(f"Invalid command arguments.")
-        else:
-            raise ValueError(f"Invalid number of arguments.")
-
-    except Exception as e:
-        logger.error(f"admin_get_fresh_resumes_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_get_fresh_resumes_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
+            # Ack before enqueueing so the 'queued' reply always precedes the task outcome
+            await send_message_to_user(update, context, text=f"Task for collecting fresh resumes queued for user {target_user_id}.")
+            _dispatch_background(
+                source_resumes_triggered_by_admin_command(bot_user_id=target_user_id),
+                update, context,
+                task_name="admin_get_fresh_resumes_command",
+                success_text=f"Fresh resumes collected for user {target_user_id}.",
+                target_user_id=target_user_id,
             )
+        else:
+            raise ValueError(f"User {target_user_id} does not have enough vacancy data for resume analysis. Skipping collection of fresh resumes.")
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
 
 
-async def admin_anazlyze_resumes_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_anazlyze_resumes_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
     Admin command to analyze fresh resumes for a specific user.
     Usage: /admin_analyze_resumes [user_id]
     """
 
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
-
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_anazlyze_resumes_command: started. User_id: {bot_user_id}")
-        
-        #  ----- VALIDATION -----
-
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        # ----- PARSE COMMAND ARGUMENTS -----
+    target_user_id = _parse_single_user_id_arg(context)
 
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    if is_vacany_data_enough_for_resume_analysis(user_id=target_user_id):
+    record = get_user_record(record_id=target_user_id)
+    if record is not None:
+        if is_record_data_enough_for_resume_analysis(record=record):
 
-                        # - TRIGGER TASK to analyze fresh resumes -
+            # - TRIGGER TASK to analyze fresh resumes in the background and ack immediately -
 
-                        await send_message_to_user(update, context, text=f"Start creating tasks for analysis of the fresh resumes for user {target_user_id}.")
-                        await analyze_resume_triggered_by_admin_command(bot_user_id=target_user_id)
-                        await send_message_to_user(update, context, text=f"Completed analysis of fresh resumes for user {target_user_id}.")
-                    else:
-                        raise ValueError(f"User {target_user_id} does not have enough vacancy data for resume analysis.")
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
-            else:
-                raise ValueError(f"Invalid command arguments.")
-        else:
-            raise ValueError(f"Invalid number of arguments.")
-    
-    except Exception as e:
-        logger.error(f"admin_anazlyze_resumes_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_anazlyze_resumes_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
+            # Ack before enqueueing so the 'queued' reply always precedes the task outcome
+            await send_message_to_user(update, context, text=f"Start creating tasks for analysis of the fresh resumes for user {target_user_id}.")
+            _dispatch_background(
+                analyze_resume_triggered_by_admin_command(bot_user_id=target_user_id),
+                update, context,
+                task_name="admin_anazlyze_resumes_command",
+                success_text=f"Completed analysis of fresh resumes for user {target_user_id}.",
+                target_user_id=target_user_id,
             )
+        else:
+            raise ValueError(f"User {target_user_id} does not have enough vacancy data for resume analysis.")
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
 
 
-async def admin_update_resume_records_with_applicants_video_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_update_resume_records_with_applicants_video_status_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
     Admin command to update resume records with fresh videos from applicants for a specific user.
     Usage: /admin_update_videos [user_id]
     """
 
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_update_resume_records_with_applicants_video_status_command: started. User_id: {bot_user_id}")
+    target_user_id = _parse_single_user_id_arg(context)
 
-        #  ----- VALIDATION -----
+    record = get_user_record(record_id=target_user_id)
+    if record is not None:
+        if get_status_bits_from_record(record) & UserStatus.VACANCY_SELECTED:
+            target_user_vacancy_id = record.get("vacancy_id") or None
+            if target_user_vacancy_id:
 
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
+                # ----- TRIGGER TASK to update resume records with fresh videos from applicants in the background and ack immediately -----
 
-        # ----- PARSE COMMAND ARGUMENTS -----
-
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    if is_vacancy_selected(record_id=target_user_id):
-                        target_user_vacancy_id = get_target_vacancy_id_from_records(record_id=target_user_id)
-                        if target_user_vacancy_id:
-
-                            # ----- TRIGGER TASK to update resume records with fresh videos from applicants -----
-
-                            await update_resume_records_with_fresh_video_from_applicants_triggered_by_admin_command(bot_user_id=target_user_id, vacancy_id=target_user_vacancy_id)
-                            await send_message_to_user(update, context, text=f"Resume records updated with fresh videos from applicants for user {target_user_id} / vacancy ID {target_user_vacancy_id}.")
-                        else:
-                            raise ValueError(f"Vacancy ID is {target_user_vacancy_id} for user {target_user_id}.")
-                    else:
-                        raise ValueError(f"User {target_user_id} did not select a vacancy.")
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
+                # Ack before enqueueing so the 'queued' reply always precedes the task outcome
+                await send_message_to_user(update, context, text=f"Task for updating resume records with fresh videos queued for user {target_user_id} / vacancy ID {target_user_vacancy_id}.")
+                _dispatch_background(
+                    update_resume_records_with_fresh_video_from_applicants_triggered_by_admin_command(bot_user_id=target_user_id, vacancy_id=target_user_vacancy_id),
+                    update, context,
+                    task_name="admin_update_resume_records_with_applicants_video_status_command",
+                    success_text=f"Resume records updated with fresh videos from applicants for user {target_user_id} / vacancy ID {target_user_vacancy_id}.",
+                    target_user_id=target_user_id,
+                )
             else:
-                raise ValueError(f"Invalid command arguments.")
+                raise ValueError(f"Vacancy ID is {target_user_vacancy_id} for user {target_user_id}.")
         else:
-            raise ValueError(f"Invalid number of arguments.")
+            raise ValueError(f"User {target_user_id} did not select a vacancy.")
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
 
-    except Exception as e:
-        logger.error(f"admin_update_resume_records_with_applicants_video_status_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_update_resume_records_with_applicants_video_status_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
-            ) 
 
-
-async def admin_recommend_resumes_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_recommend_resumes_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
     Admin command to recommend applicants with video for all users.
     Usage: /admin_recommend [user_id]
     """
 
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
-
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_recommend_resumes_command: started. User_id: {bot_user_id}")
-        
-        #  ----- VALIDATION -----
-
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        # ----- PARSE COMMAND ARGUMENTS -----
+    target_user_id = _parse_single_user_id_arg(context)
 
-        target_user_id = None
-        if context.args and len(context.args) == 1:
-            target_user_id = context.args[0]
-            if target_user_id:
-                if is_user_in_records(record_id=target_user_id):
-                    if is_vacany_data_enough_for_resume_analysis(user_id=target_user_id):
+    record = get_user_record(record_id=target_user_id)
+    if record is not None:
+        if is_record_data_enough_for_resume_analysis(record=record):
 
-                        # ----- TRIGGER TASK to recommend resumes -----
+            # ----- TRIGGER TASK to recommend resumes on the user's queue -----
 
-                        await recommend_resumes_triggered_by_admin_command(bot_user_id=target_user_id, application=context.application)
-                        await send_message_to_user(update, context, text="Recommending resumes is triggered for user {target_user_id}.")
-                    else:
-                        raise ValueError(f"User {target_user_id} does not have enough vacancy data for resume analysis. Skipping recommendation of resumes.")
-                else:
-                    raise ValueError(f"User {target_user_id} not found in records.")
-            else:
-                raise ValueError(f"Invalid command arguments.")
-        else:
-            raise ValueError(f"Invalid number of arguments.")
-    
-    except Exception as e:
-        logger.error(f"admin_recommend_resumes_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_recommend_resumes_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
+            # Ack before enqueueing so the 'queued' reply always precedes the task outcome
+            await send_message_to_user(update, context, text=f"Recommending resumes is triggered for user {target_user_id}.")
+            _dispatch_background(
+                recommend_resumes_triggered_by_admin_command(bot_user_id=target_user_id, application=context.application),
+                update, context,
+                task_name="admin_recommend_resumes_command",
+                success_text=f"Recommending resumes completed for user {target_user_id}.",
+                target_user_id=target_user_id,
             )
+        else:
+            raise ValueError(f"User {target_user_id} does not have enough vacancy data for resume analysis. Skipping recommendation of resumes.")
+    else:
+        raise ValueError(f"User {target_user_id} not found in records.")
 
 
-async def admin_send_message_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+@admin_only
+async def admin_send_message_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
     Admin command to send a message to a specific user by user_id (chat_id).
     Usage: /admin_send_message <user_id> <message_text>
     Usage example: /admin_send_message 7853115214 Привет! Как дела?
     """
-    
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
-
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_send_message_command: started. User_id: {bot_user_id}")
-        
-        #  ----- VALIDATION -----
 
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
-
-        # ----- PARSE COMMAND ARGUMENTS -----
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        if not context.args or len(context.args) < 2:
-            raise ValueError(f"Invalid number of arguments.")
-        
-        target_user_id = context.args[0]
-        message_text = " ".join(context.args[1:])  # Join all remaining arguments as message text
+    if not context.args or len(context.args) < 2:
+        raise ValueError(f"Invalid number of arguments.")
 
-        # ----- VALIDATE USER_ID -----
+    target_user_id = context.args[0]
+    message_text = " ".join(context.args[1:])  # Join all remaining arguments as message text
 
-        try:
-            target_user_id_int = int(target_user_id)
-        except ValueError:
-            raise ValueError(f"Invalid command arguments.")
+    # ----- VALIDATE USER_ID -----
 
-        # ----- SEND MESSAGE TO USER -----
-
-        if context.application and context.application.bot:
-            try:
-                await context.application.bot.send_message(
-                    chat_id=target_user_id_int,
-                    text=message_text
-                )
-                await send_message_to_user(update, context, text=f"Message sent to user {target_user_id}:\n'{message_text}'")
-                logger.info(f"admin_send_message_command: Admin {bot_user_id} sent message to user {target_user_id}: {message_text}")
-            except Exception as send_err:
-                error_msg = f"Fail to send message to user {target_user_id}: {send_err}"
-                await send_message_to_user(update, context, text=error_msg)
-                logger.error(f"admin_send_message_command: Failed to send message to user {target_user_id}: {send_err}", exc_info=True)
-                raise
-        else:
-            raise ValueError("Application or bot instance not available")
-    
-    except Exception as e:
-        logger.error(f"admin_send_message_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_send_message_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
-            )
+    try:
+        target_user_id_int = int(target_user_id)
+    except ValueError:
+        raise ValueError(f"Invalid command arguments.")
 
+    # ----- SEND MESSAGE TO USER -----
 
-async def admin_pull_file_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    try:
+        await context.bot.send_message(
+            chat_id=target_user_id_int,
+            text=message_text
+        )
+        await send_message_to_user(update, context, text=f"Message sent to user {target_user_id}:\n'{message_text}'")
+        logger.info(f"admin_send_message_command: Admin {bot_user_id} sent message to user {target_user_id}: {message_text}")
+    except Exception as send_err:
+        error_msg = f"Fail to send message to user {target_user_id}: {send_err}"
+        await send_message_to_user(update, context, text=error_msg)
+        logger.error(f"admin_send_message_command: Failed to send message to user {target_user_id}: {send_err}", exc_info=True)
+        raise
+
+
+@admin_only
+async def admin_pull_file_command(update: Update, context: ContextTypes.DEFAULT_TYPE, bot_user_id: str) -> None:
     #TAGS: [admin]
     """
     Admin command to pull and send file back to user.
     Usage: /admin_pull_file [file_relative_path]
     Usage example: /admin_pull_file logs/manager_bot_logs/1234432.log
     """
-    
-    try:
-        # ----- IDENTIFY USER and pull required data from records -----
 
-        bot_user_id = str(get_tg_user_data_attribute_from_update_object(update=update, tg_user_attribute="id"))
-        logger.info(f"admin_pull_file_command: started. User_id: {bot_user_id}")
-        
-        #  ----- VALIDATION -----
-
-        admin_id = os.getenv("ADMIN_ID", "")
-        if not admin_id or bot_user_id != admin_id:
-            await send_message_to_user(update, context, text=FAIL_TO_IDENTIFY_USER_AS_ADMIN_TEXT)
-            logger.error(f"Unauthorized for {bot_user_id}")
-            return
+    # ----- PARSE COMMAND ARGUMENTS -----
 
-        # ----- PARSE COMMAND ARGUMENTS -----
+    if not context.args or len(context.args) != 1:
+        raise ValueError(f"Invalid number of arguments.")
 
-        if not context.args or len(context.args) != 1:
-            raise ValueError(f"Invalid number of arguments.")
-        
-        file_relative_path = context.args[0]
+    file_relative_path = context.args[0]
 
-        # ----- CONSTRUCT LOG FILE PATH -----
+    # ----- VALIDATE FILE EXTENSION -----
 
-        data_dir = Path(os.getenv("USERS_DATA_DIR", "/users_data"))
-        file_path = data_dir / file_relative_path
-        file_name = file_path.name
+    # One rfind on the raw argument instead of Path.suffix's property
+    # machinery, and the check runs before the path is even constructed
+    dot = file_relative_path.rfind('.')
+    file_extension = file_relative_path[dot:] if dot >= 0 else ""
+    if file_extension not in _VALID_PULL_EXTENSIONS:
+        invalid_extension_text = f"Invalid file extension.\nValid: {_VALID_PULL_EXTENSIONS_STR}"
+        raise ValueError(invalid_extension_text)
 
-        # ----- VALIDATE FILE EXTENSION -----
+    # ----- CONSTRUCT LOG FILE PATH -----
 
-        valid_extensions = [".log", ".json", ".mp4"]
-        file_extension = file_path.suffix
-        if file_extension not in valid_extensions:
-            invalid_extension_text = f"Invalid file extension.\nValid: {', '.join(valid_extensions)}"
-            raise ValueError(invalid_extension_text)
+    # Resolve once and reject paths escaping the data directory before any
+    # filesystem syscall (e.g. '../../etc/passwd' never reaches stat/open)
+    file_path = (USERS_DATA_DIR / file_relative_path).resolve(strict=False)
+    try:
+        file_path.relative_to(_USERS_DATA_DIR_RESOLVED)
+    except ValueError:
+        raise ValueError(f"Invalid file relative path'{file_relative_path}'. Path escapes data directory")
+    file_name = file_path.name
 
-        # ----- CHECK IF FILE EXISTS -----
+    # ----- CHECK IF FILE EXISTS (stat syscall runs off the event loop) -----
 
-        if not file_path.exists():
-            invalid_path_text = f"Invalid file relative path'{file_relative_path}'. File not found"
-            raise FileNotFoundError(invalid_path_text)
+    if not await asyncio.to_thread(file_path.exists):
+        invalid_path_text = f"Invalid file relative path'{file_relative_path}'. File not found"
+        raise FileNotFoundError(invalid_path_text)
 
-        # ----- SEND LOG FILE TO USER -----
+    # ----- SEND LOG FILE TO USER -----
 
-        if context.application and context.application.bot:
-            try:
-                chat_id = update.effective_chat.id
-                with open(file_path, 'rb') as file:
-                    await context.application.bot.send_document(
-                        chat_id=chat_id,
-                        document=InputFile(file, filename=file_name)
-                    )
-                logger.info(f"admin_pull_file_command: file '{file_path}' sent to user {bot_user_id}")
-            except Exception as send_err:
-                raise TelegramError(f"Failed to send file '{file_path}': {send_err}")
+    try:
+        chat_id = update.effective_chat.id
+
+        # Resend by Telegram file_id if this exact file version was uploaded
+        # before: Telegram reuses the stored bytes, no re-upload needed
+        cache_key = (str(file_path), (await asyncio.to_thread(file_path.stat)).st_mtime)
+        cached_file_id = _file_id_cache.get(cache_key)
+        if cached_file_id:
+            await context.bot.send_document(chat_id=chat_id, document=cached_file_id)
+            logger.info(f"admin_pull_file_command: file '{file_path}' resent via cached file_id to user {bot_user_id}")
         else:
-            raise RuntimeError("Application or bot instance not available")
-    except Exception as e:
-        logger.error(f"admin_pull_file_command: Failed: {e}", exc_info=True)
-        # Send notification to admin about the error
-        if context.application:
-            await send_message_to_admin(
-                application=context.application,
-                text=f"⚠️ Error admin_pull_file_command: {e}\nAdmin ID: {bot_user_id if 'bot_user_id' in locals() else 'unknown'}"
+            # Read asynchronously so a large .mp4 does not stall the event loop
+            # and freeze handlers for all other chats
+            async with aiofiles.open(file_path, 'rb') as file:
+                data = await file.read()
+            # Hand the bytes straight to InputFile: the io.BytesIO wrapper
+            # copied the whole buffer a second time, doubling peak memory
+            # for large pulls
+            message = await context.bot.send_document(
+                chat_id=chat_id,
+                document=InputFile(data, filename=file_name)
             )
-
+            if message and message.document:
+                _file_id_cache[cache_key] = message.document.file_id
+            logger.info(f"admin_pull_file_command: file '{file_path}' sent to user {bot_user_id}")
+    except TelegramError:
+        raise
+    except Exception as send_err:
+        raise TelegramError(f"Failed to send file '{file_path}': {send_err}")
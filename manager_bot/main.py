@@ -4,9 +4,11 @@ import os
 from dotenv import load_dotenv
 
 from manager_bot import (
-    create_manager_application, 
-    ai_task_queue, 
-    start_command, 
+    create_manager_application,
+    ai_task_queue,
+    start_command,
+    flush_admin_notifications,
+    init_admin,
 )
 
 from admin import (
@@ -21,6 +23,7 @@ from admin import (
     admin_recommend_resumes_command,
     admin_send_message_command,
     admin_pull_file_command,
+    shutdown_user_queues,
 )
 
 from services.data_service import (
@@ -83,6 +86,7 @@ async def run_manager_bot() -> None:
     if not manager_token:
         raise RuntimeError("HRVIBE_MANAGER_BOT_TOKEN not found in environment variables")
     application = create_manager_application(manager_token)
+    init_admin(application)
     application.add_handler(CommandHandler("start", _show_bottom_menu_on_start), group=-1)
     application.add_handler(CommandHandler("admin_get_managers", admin_get_managers_command))
     application.add_handler(CommandHandler("admin_get_manager_status", admin_get_manager_status_command))
@@ -134,7 +138,22 @@ async def run_manager_bot() -> None:
                 logger.info("Task queue worker that processes AI related tasks is stopped.")
             except Exception as e:
                 logger.error(f"Error stopping task queue worker that processes AI related tasks: {e}")
-            
+
+            # ------------- SHUTDOWN OF PER-USER ADMIN TASK QUEUE WORKERS -------------
+
+            try:
+                await shutdown_user_queues()
+                logger.info("Per-user admin task queue workers are stopped.")
+            except Exception as e:
+                logger.error(f"Error stopping per-user admin task queue workers: {e}")
+
+            # ------------- FLUSH PENDING ADMIN NOTIFICATIONS before the bot stops -------------
+
+            try:
+                await flush_admin_notifications()
+            except Exception as e:
+                logger.error(f"Error flushing pending admin notifications: {e}")
+
             # ------------- SHUTDOWN OF THE APPLICATION in proper sequence -------------  
             
             try:
@@ -129,6 +129,20 @@ HH_CLIENT_ID = os.getenv("HH_CLIENT_ID")
 HH_CLIENT_SECRET = os.getenv("HH_CLIENT_SECRET")
 OAUTH_REDIRECT_URL = os.getenv("OAUTH_REDIRECT_URL")
 USER_AGENT = os.getenv("USER_AGENT")
+ADMIN_ID = os.getenv("ADMIN_ID", "")
+ADMIN_ID_INT: Optional[int] = int(ADMIN_ID) if ADMIN_ID.isdigit() else None
+
+# The bot object is a process-wide singleton: resolved once in init_admin at
+# startup instead of walking application.bot on every admin notification
+_BOT_REF = None
+
+
+def init_admin(application: Application) -> None:
+    #TAGS: [support]
+    """Cache the singleton bot reference for admin notifications. Called once from main.py startup."""
+    global _BOT_REF
+    _BOT_REF = application.bot
+    logger.info("init_admin: bot reference cached for admin notifications.")
 
 # Global task queue for AI analysis tasks
 ai_task_queue = TaskQueue(maxsize=500)
@@ -139,32 +153,111 @@ ai_task_queue = TaskQueue(maxsize=500)
 #############################################
 
 
+class AdminNotifier:
+    #TAGS: [support]
+    """Batches admin notifications to stay under Telegram's per-bot rate limit.
+
+    Messages are queued and a background worker waits up to BATCH_WINDOW_SECONDS
+    for more of them, concatenates up to MAX_BATCH_CHARS into a single
+    send_message call, and drops duplicate texts within a batch. Ordering is
+    preserved; a burst of N errors produces one outbound Telegram call instead
+    of N. Pending messages are flushed on shutdown via flush()."""
+
+    BATCH_WINDOW_SECONDS = 0.5
+    MAX_BATCH_CHARS = 3500
+
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_task: Optional[asyncio.Task] = None
+
+    async def notify(self, application: Application, text: str, parse_mode: Optional[ParseMode] = None) -> None:
+        """Queue a notification for the admin; the worker batches and sends it."""
+        # Lazy worker start: the notifier is created at import time, before the
+        # event loop exists, so the worker task is spawned on first use
+        if self._worker_task is None or self._worker_task.done():
+            self._worker_task = asyncio.create_task(self._worker())
+        await self._queue.put((application, text, parse_mode))
+
+    async def _worker(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                # Debounce: collect messages arriving shortly after the first one
+                while sum(len(text) for _, text, _ in batch) < self.MAX_BATCH_CHARS:
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout=self.BATCH_WINDOW_SECONDS))
+                    except asyncio.TimeoutError:
+                        break
+                await self._send_batch(batch)
+            except asyncio.CancelledError:
+                # Flush the in-flight batch before the task dies (shutdown path)
+                await self._send_batch(batch)
+                raise
+
+    async def _send_batch(self, batch: list) -> None:
+        # One message per parse_mode, ordering preserved, duplicate texts dropped
+        groups: dict = {}
+        for application, text, parse_mode in batch:
+            group = groups.setdefault(parse_mode, {"application": application, "texts": [], "seen": set()})
+            if text not in group["seen"]:
+                group["seen"].add(text)
+                group["texts"].append(text)
+        for parse_mode, group in groups.items():
+            application = group["application"]
+            combined = "\n\n".join(group["texts"])
+            bot = _BOT_REF if _BOT_REF is not None else (application.bot if application else None)
+            try:
+                if bot is not None:
+                    await bot.send_message(
+                        chat_id=ADMIN_ID_INT if ADMIN_ID_INT is not None else int(ADMIN_ID),
+                        text=combined,
+                        parse_mode=parse_mode
+                    )
+                    logger.debug(f"AdminNotifier: sent batch of {len(group['texts'])} notification(s) to admin_id: {ADMIN_ID}")
+                else:
+                    logger.warning("AdminNotifier: Cannot send admin notification: application or bot instance not available")
+            except Exception as e:
+                logger.error(f"AdminNotifier: Failed to send admin notification: {e}", exc_info=True)
+
+    async def flush(self) -> None:
+        """Stop the worker and send everything still pending. Called on shutdown."""
+        if self._worker_task is not None and not self._worker_task.done():
+            self._worker_task.cancel()
+            try:
+                await self._worker_task
+            except asyncio.CancelledError:
+                pass
+        self._worker_task = None
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        if batch:
+            await self._send_batch(batch)
+
+
+_admin_notifier = AdminNotifier()
+
+
 async def send_message_to_admin(application: Application, text: str, parse_mode: Optional[ParseMode] = None) -> None:
     #TAGS: [support]
 
     logger.info(f"send_message_to_admin: started.")
 
-    # ----- GET ADMIN ID from environment variables -----
-    
-    admin_id = os.getenv("ADMIN_ID", "")
-    if not admin_id:
+    # ----- GET ADMIN ID cached from environment variables at import time -----
+
+    if not ADMIN_ID:
         logger.error("send_message_to_admin:ADMIN_ID environment variable is not set. Cannot send admin notification.")
         return
-    
-    # ----- SEND NOTIFICATION to admin -----
-    
-    try:
-        if application and application.bot:
-            await application.bot.send_message(
-                chat_id=int(admin_id),
-                text=text,
-                parse_mode=parse_mode
-            )
-            logger.debug(f"send_message_to_admin: Admin notification sent successfully to admin_id: {admin_id}")
-        else:
-            logger.warning("send_message_to_admin: Cannot send admin notification: application or bot instance not available")
-    except Exception as e:
-        logger.error(f"send_message_to_admin: Failed to send admin notification: {e}", exc_info=True)
+
+    # ----- QUEUE NOTIFICATION to admin (batched by AdminNotifier) -----
+
+    await _admin_notifier.notify(application=application, text=text, parse_mode=parse_mode)
+
+
+async def flush_admin_notifications() -> None:
+    #TAGS: [support]
+    """Flush admin notifications still pending in the batching queue. Called on shutdown."""
+    await _admin_notifier.flush()
 
 
 ########################################################################################
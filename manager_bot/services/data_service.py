@@ -161,6 +161,9 @@ def create_record_for_new_user_in_records(record_id: str) -> None:
         records[record_id] = standard_new_user_values
         users_records_file_path.write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding="utf-8")
         logger.debug(f"Record ID '{record_id}' added to records")
+        # Deferred import: status_validation_service imports data_service at module level
+        from services.status_validation_service import invalidate_user_in_records_cache
+        invalidate_user_in_records_cache(record_id=record_id)
     else:
         logger.debug(f"Record ID '{record_id}' already exists in records, skipping update")
 
@@ -562,6 +565,20 @@ def get_list_of_users_from_records() -> list[str]:
     return list(records.keys())
 
 
+def get_user_record(record_id: str) -> Optional[dict]:
+    # TAGS: [get_data]
+    """Get the full record for a user from users records, or None if user is not in records.
+    Lets callers read the records file once and inspect several status fields locally,
+    instead of re-reading the file for every single check."""
+    users_records_file_path = get_users_records_file_path()
+    with open(users_records_file_path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    record = records.get(record_id)
+    if record is None:
+        logger.debug(f"'record_id': {record_id} not found in {users_records_file_path}")
+    return record
+
+
 def get_user_name_from_records(record_id: str) -> Optional[str]:
     # TAGS: [get_data]
     """Get user name from users records."""
@@ -600,6 +617,9 @@ def update_user_records_with_top_level_key(record_id: int | str, key: str, value
             records[record_id_str][key] = value
             users_records_path.write_text(json.dumps(records, ensure_ascii=False, indent=2), encoding="utf-8")
             logger.info(f"{record_id_str} has been successfully updated with {key}={value}")
+            # Deferred import: status_validation_service imports data_service at module level
+            from services.status_validation_service import invalidate_user_in_records_cache
+            invalidate_user_in_records_cache(record_id=record_id_str)
         else:
             raise ValueError(f"User record {record_id_str} does not exist in the file {users_records_path}")
     except Exception as e:
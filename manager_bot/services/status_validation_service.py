@@ -3,7 +3,10 @@
 
 import json
 import logging
+import time
+from enum import IntFlag
 from pathlib import Path
+from typing import Optional
 from services.data_service import (
     get_users_records_file_path,
     get_resume_records_file_path,
@@ -13,20 +16,75 @@ from services.data_service import (
 logger = logging.getLogger(__name__)
 
 
+class UserStatus(IntFlag):
+    # TAGS: [status_validation]
+    """User record status flags packed into one integer, so several checks
+    cost one bitwise AND each instead of a separate record read per flag."""
+    AUTHORIZED = 1
+    VACANCY_SELECTED = 2
+    VACANCY_DESC_RECEIVED = 4
+    SOURCING_CRITERIAS_RECEIVED = 8
+
+
+# All flags required before resume sourcing/analysis may run
+ENOUGH_FOR_RESUME_ANALYSIS = (
+    UserStatus.AUTHORIZED
+    | UserStatus.VACANCY_SELECTED
+    | UserStatus.VACANCY_DESC_RECEIVED
+    | UserStatus.SOURCING_CRITERIAS_RECEIVED
+)
+
+
+def get_status_bits_from_record(record: dict) -> UserStatus:
+    # TAGS: [status_validation]
+    """Pack the 'yes'/'no' status fields of a loaded user record into one UserStatus bitmask."""
+    bits = UserStatus(0)
+    if record.get("access_token_recieved") == "yes":
+        bits |= UserStatus.AUTHORIZED
+    if record.get("vacancy_selected") == "yes":
+        bits |= UserStatus.VACANCY_SELECTED
+    if record.get("vacancy_description_recieved") == "yes":
+        bits |= UserStatus.VACANCY_DESC_RECEIVED
+    if record.get("vacancy_sourcing_criterias_recieved") == "yes":
+        bits |= UserStatus.SOURCING_CRITERIAS_RECEIVED
+    return bits
+
+
+# Membership results are cached for a short TTL: a debugging session typically
+# fires several commands at the same user in a row, and every is_user_in_records
+# call re-reads and re-parses the whole records file otherwise. Write-side
+# data_service functions invalidate entries on mutation.
+_USER_IN_RECORDS_TTL_SECONDS = 5.0
+_user_in_records_cache: dict = {}
+
+
+def invalidate_user_in_records_cache(record_id: Optional[str] = None) -> None:
+    # TAGS: [status_validation]
+    """Drop cached membership results after a write to the users records file."""
+    if record_id is None:
+        _user_in_records_cache.clear()
+    else:
+        _user_in_records_cache.pop(str(record_id), None)
+
 
 # ****** METHODS with TAGS: [status_validation] ******
 
 def is_user_in_records(record_id: str) -> bool:
     # TAGS: [status_validation]
-    """Check if user is in records."""
+    """Check if user is in records. Results are cached for a few seconds (see
+    invalidate_user_in_records_cache for the write-side invalidation hook)."""
+    now = time.monotonic()
+    cached = _user_in_records_cache.get(record_id)
+    if cached is not None and now < cached[1]:
+        return cached[0]
     users_records_file_path = get_users_records_file_path()
     with open(users_records_file_path, "r", encoding="utf-8") as f:
         records = json.load(f)
-    if record_id in records:
-        return True
-    else:
+    result = record_id in records
+    if not result:
         logger.debug(f"'record_id': {record_id} not found in records")
-        return False
+    _user_in_records_cache[record_id] = (result, now + _USER_IN_RECORDS_TTL_SECONDS)
+    return result
 
 
 def is_manager_privacy_policy_confirmed(bot_user_id: str) -> bool:
@@ -255,6 +313,15 @@ def is_vacany_data_enough_for_resume_analysis(user_id: str) -> bool:
     )
 
 
+def is_record_data_enough_for_resume_analysis(record: dict) -> bool:
+    # TAGS: [status_validation]
+    """
+    Same check as is_vacany_data_enough_for_resume_analysis, but on an
+    already-loaded user record: one read of the records file instead of four.
+    """
+    return get_status_bits_from_record(record) & ENOUGH_FOR_RESUME_ANALYSIS == ENOUGH_FOR_RESUME_ANALYSIS
+
+
 def is_resume_accepted(bot_user_id: str, vacancy_id: str, resume_id: str) -> bool:
     # TAGS: [status_validation]
     """Check if resume is accepted."""